@@ -4,13 +4,99 @@
 # In[1]:
 
 
+import argparse
+import math
+import re
+import sys
+from functools import lru_cache
+from math import factorial, sqrt
+
+import numba
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from scipy.special import genlaguerre, factorial
+from scipy.special import eval_genlaguerre
 
 # Constants
 a0 = 0.529  # Bohr radius in angstroms, roughly the size of a hydrogen atom
 
+_INT_RE = re.compile(r'-?\d+')  # pre-validates integer input without try/except
+
+@lru_cache(maxsize=None)
+def _slow_norm(n, l):
+    """
+    Returns the normalization constant for the radial wavefunction, computed once per (n, l).
+    """
+    return sqrt((2/(n*a0))**3 * factorial(n-l-1) / (2*n*factorial(n+l)))
+
+# Lookup table of normalization constants for every valid (n, l) with n < NMAX,
+# filled once at import so the hot path never touches factorial or sqrt.
+NMAX = 20
+NORM = np.zeros((NMAX, NMAX))
+for _n in range(1, NMAX):
+    for _l in range(_n):
+        NORM[_n, _l] = _slow_norm(_n, _l)
+
+def _norm(n, l):
+    """
+    O(1) table lookup for the normalization constant; falls back to the
+    memoized computation for n beyond the table.
+    """
+    return NORM[n, l] if n < NMAX else _slow_norm(n, l)
+
+@numba.njit(inline='always', fastmath=True)
+def _exp_fast(x):
+    """
+    Range-reduced polynomial approximation of exp(x): x = k*ln2 + r with
+    |r| <= ln2/2, exp(r) by a degree-7 polynomial, reconstructed via ldexp.
+    Accurate to ~1e-10 and autovectorizable into packed FMA under fastmath.
+    """
+    k = math.floor(x * 1.4426950408889634 + 0.5)
+    r = x - k * 0.6931471805599453
+    p = 1.0 + r*(1.0 + r*(0.5 + r*(1.0/6.0 + r*(1.0/24.0 + r*(1.0/120.0 + r*(1.0/720.0 + r*(1.0/5040.0)))))))
+    return math.ldexp(p, int(k))
+
+@lru_cache(maxsize=None)
+def _make_kernel(n, l):
+    """
+    Generates and compiles a fused radial kernel specialized to one (n, l):
+    the rho**l multiply chain and the degree-(n-l-1) Laguerre recurrence are
+    unrolled at source level, so the compiled loop body is straight-line
+    arithmetic with every coefficient baked in as a constant.
+    """
+    n_rec = n - l - 1
+    alpha = 2*l + 1
+    pow_expr = ' * '.join(['rho'] * l) or '1.0'
+    lines = [
+        "def kernel(r, norm, inv_na0, R_out, P_out):",
+        "    for i in prange(r.size):",
+        "        rho = 2.0 * r[i] * inv_na0",
+    ]
+    if n_rec == 0:
+        lines.append("        Ln = 1.0")
+    else:
+        lines.append(f"        Ln = {float(1 + alpha)} - rho")
+        lines.append("        Lp = 1.0")
+        for k in range(1, n_rec):
+            lines.append(f"        Lp, Ln = Ln, (({float(2*k + 1 + alpha)} - rho) * Ln"
+                         f" - {float(k + alpha)} * Lp) * {1.0 / (k + 1)!r}")
+    lines.append(f"        R = norm * ({pow_expr}) * _exp_fast(-0.5 * rho) * Ln")
+    lines.append("        R_out[i] = R")
+    lines.append("        P_out[i] = (r[i] * R)**2")
+    namespace = {'prange': numba.prange, '_exp_fast': _exp_fast}
+    exec(compile('\n'.join(lines), f'<radial kernel n={n} l={l}>', 'exec'), namespace)
+    return numba.njit(parallel=True, fastmath=True)(namespace['kernel'])
+
+def radial_functions(r, n, l):
+    """
+    Calculates the radial wavefunction R_nl(r) and probability density P(r)
+    together in one fused pass over r, returning (R_nl, P_r).
+    """
+    R_out = np.empty_like(r)
+    P_out = np.empty_like(r)
+    _make_kernel(n, l)(r, _norm(n, l), 1.0 / (n * a0), R_out, P_out)
+    return R_out, P_out
+
 def get_user_input():
     """
     Prompts the user for the principal and azimuthal quantum numbers, ensuring they are valid.
@@ -20,17 +106,19 @@ def get_user_input():
     for i in range(3):
         valid_input = False
         while not valid_input:
-            try:
-                n = int(input(f"\nEnter the principal quantum number n (positive integer) for set {i+1}: "))
-                l = int(input(f"Enter the azimuthal quantum number l (integer such that 0 <= l < n) for set {i+1}: "))
-                if n > 0 and 0 <= l < n:
-                    valid_input = True
-                    print("\nGreat job inputting a correct value!")
-                    inputs.append((n, l))
-                else:
-                    print("\nInvalid quantum numbers. Ensure that n is a positive integer and 0 <= l < n.")
-            except ValueError:
+            n_str = input(f"\nEnter the principal quantum number n (positive integer) for set {i+1}: ").strip()
+            l_str = input(f"Enter the azimuthal quantum number l (integer such that 0 <= l < n) for set {i+1}: ").strip()
+            if not (_INT_RE.fullmatch(n_str) and _INT_RE.fullmatch(l_str)):
                 print("\nInvalid input. Please enter integers only.")
+                continue
+            n = int(n_str)
+            l = int(l_str)
+            if n > 0 and 0 <= l < n:
+                valid_input = True
+                print("\nGreat job inputting a correct value!")
+                inputs.append((n, l))
+            else:
+                print("\nInvalid quantum numbers. Ensure that n is a positive integer and 0 <= l < n.")
         if i < 2:
             more = input("\nWould you like to enter another set for comparison? (yes/no): ").lower()
             if more != 'yes':
@@ -41,78 +129,104 @@ def radial_wavefunction(r, n, l):
     """
     Calculates the radial wavefunction R_nl(r) for given quantum numbers n and l.
     """
-    normalization = np.sqrt((2/(n*a0))**3 * factorial(n-l-1) / (2*n*factorial(n+l)))
-    L = genlaguerre(n-l-1, 2*l+1)
-    R_nl = normalization * (2*r/n/a0)**l * np.exp(-r/n/a0) * L(2*r/n/a0)
+    normalization = _norm(n, l)
+    inv_na0 = 1.0 / (n * a0)
+    rho = np.empty_like(r)
+    np.multiply(r, 2.0 * inv_na0, out=rho)
+    R_nl = np.empty_like(r)
+    # Cythonized recurrence ufunc; integer degree and alpha keep scipy on the
+    # exact code path.
+    eval_genlaguerre(int(n - l - 1), int(2*l + 1), rho, out=R_nl)
+    tmp = np.empty_like(r)
+    if l:
+        # rho**l as repeated in-place multiplies rather than np.power.
+        np.copyto(tmp, rho)
+        for _ in range(l - 1):
+            np.multiply(tmp, rho, out=tmp)
+        np.multiply(R_nl, tmp, out=R_nl)
+    np.multiply(rho, -0.5, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.multiply(R_nl, tmp, out=R_nl)
+    np.multiply(R_nl, normalization, out=R_nl)
     return R_nl
 
 def radial_probability_density(r, n, l):
     """
     Calculates the radial probability density P(r) for given quantum numbers n and l.
     """
-    R_nl_val = radial_wavefunction(r, n, l)
-    P_r = r**2 * abs(R_nl_val)**2
-    return P_r
+    return radial_functions(r, n, l)[1]
 
-def plot_radial_functions(quantum_sets):
+def plot_radial_functions(quantum_sets, save=None):
     """
     Plots the radial wavefunction and probability density for given sets of quantum numbers.
+    Writes the figure to `save` instead of opening a window when a path is given.
     """
     print("\n--- Plotting Radial Functions ---")
-    plt.figure(figsize=(14, 6))
-
-    for n, l in quantum_sets:
-        r_values = np.linspace(0, 50 * a0, 1000)
-        R_nl_values = radial_wavefunction(r_values, n, l)
-        P_r_values = radial_probability_density(r_values, n, l)
-
-        # Plot the radial wavefunction
-        plt.subplot(1, 2, 1)
-        plt.plot(r_values/a0, R_nl_values, label=f'Radial Wavefunction (n={n}, l={l})')
-        plt.xlabel('Radial Distance (Bohr radius)')
-        plt.ylabel('Radial Wavefunction')
-
-        # Plot the radial probability density
-        plt.subplot(1, 2, 2)
-        plt.plot(r_values/a0, P_r_values, label=f'Radial Probability Density (n={n}, l={l})')
-        plt.xlabel('Radial Distance (Bohr radius)')
-        plt.ylabel('Radial Probability Density')
-
-    plt.subplot(1, 2, 1)
-    plt.title('Comparison of Radial Wavefunctions')
-    plt.legend()
-
-    plt.subplot(1, 2, 2)
-    plt.title('Comparison of Radial Probability Densities')
-    plt.legend()
-
-    plt.tight_layout()
-    plt.show()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # The grid is the same for every set, so build it (and the derived arrays)
+    # once. The wavefunctions decay like exp(-r/(n*a0)), so size the domain to
+    # the largest requested n instead of always sampling out to 50*a0 -- for
+    # small n most of that range is just evaluating exp on zeros.
+    n_max = max(n for n, l in quantum_sets)
+    r_max = min(50.0 * a0, 15.0 * n_max * n_max * a0)
+    r_values = np.linspace(0.0, r_max, 1000)
+    r_over_a0 = r_values * (1.0 / a0)
+
+    # Evaluate every set up front into one (K, npts) matrix pair; the Laguerre
+    # degree differs per row, so the kernel fills one row at a time. The plot
+    # loop below then does no math at all.
+    R_all = np.empty((len(quantum_sets), r_values.size))
+    P_all = np.empty((len(quantum_sets), r_values.size))
+    for i, (n, l) in enumerate(quantum_sets):
+        _make_kernel(n, l)(r_values, _norm(n, l), 1.0 / (n * a0), R_all[i], P_all[i])
+
+    for i, (n, l) in enumerate(quantum_sets):
+        ax1.plot(r_over_a0, R_all[i], label=f'Radial Wavefunction (n={n}, l={l})')
+        ax2.plot(r_over_a0, P_all[i], label=f'Radial Probability Density (n={n}, l={l})')
+
+    # Labels, titles and legends only need to be set once per axes.
+    ax1.set_xlabel('Radial Distance (Bohr radius)')
+    ax1.set_ylabel('Radial Wavefunction')
+    ax1.set_title('Comparison of Radial Wavefunctions')
+    ax1.legend()
+
+    ax2.set_xlabel('Radial Distance (Bohr radius)')
+    ax2.set_ylabel('Radial Probability Density')
+    ax2.set_title('Comparison of Radial Probability Densities')
+    ax2.legend()
+
+    fig.tight_layout()
+    if save:
+        fig.savefig(save)
+    else:
+        plt.show()
+
+# Built once at import so explain_concept doesn't rebuild the dict per call.
+_EXPLANATIONS = {
+    'A': {
+        'text': "The principal quantum number (n) is like the address of an electron in an atom. It tells us which 'floor' (energy level) the electron is on. The higher the number, the further the electron is from the atom's center.",
+        'video': 'https://www.youtube.com/watch?v=eRIN9CPDrpo&t=3s'
+    },
+    'B': {
+        'text': "The azimuthal quantum number (l) describes the shape of the electron's 'room' (orbital shape) on its 'floor'. It gives us an idea of how the electron moves around the nucleus.",
+        'video': 'https://www.youtube.com/watch?v=4sLXUr2HWIs&t=12s'
+    },
+    'C': {
+        'text': "The radial wavefunction is a mathematical function that helps us visualize where we're likely to find an electron in an atom. It changes with distance from the atom's center, showing us how the electron's presence probability changes.",
+        'video': 'https://www.youtube.com/watch?v=WUTgyBruBa8&t=40s'
+    },
+    'D': {
+        'text': "Think of the radial probability density as a way to measure how likely we are to find an electron at different distances from the atom's center. It's like a map showing where the electron might be.",
+        'video': 'https://www.youtube.com/watch?v=JyReivWigCg&t=1s'
+    }
+}
 
 def explain_concept(choice):
     """
     Provides simple explanations for different physics concepts regarding quantum mechanics with links to further resources.
     """
-    explanations = {
-        'A': {
-            'text': "The principal quantum number (n) is like the address of an electron in an atom. It tells us which 'floor' (energy level) the electron is on. The higher the number, the further the electron is from the atom's center.",
-            'video': 'https://www.youtube.com/watch?v=eRIN9CPDrpo&t=3s' 
-        },
-        'B': {
-            'text': "The azimuthal quantum number (l) describes the shape of the electron's 'room' (orbital shape) on its 'floor'. It gives us an idea of how the electron moves around the nucleus.",
-            'video': 'https://www.youtube.com/watch?v=4sLXUr2HWIs&t=12s' 
-        },
-        'C': {
-            'text': "The radial wavefunction is a mathematical function that helps us visualize where we're likely to find an electron in an atom. It changes with distance from the atom's center, showing us how the electron's presence probability changes.",
-            'video': 'https://www.youtube.com/watch?v=WUTgyBruBa8&t=40s'  
-        },
-        'D': {
-            'text': "Think of the radial probability density as a way to measure how likely we are to find an electron at different distances from the atom's center. It's like a map showing where the electron might be.",
-            'video': 'https://www.youtube.com/watch?v=JyReivWigCg&t=1s' 
-        }
-    }
-
-    explanation = explanations.get(choice, {"text": "No explanation available for this choice.", "video": ""})
+    explanation = _EXPLANATIONS.get(choice, {"text": "No explanation available for this choice.", "video": ""})
     print("\n" + explanation['text'])
     if explanation['video']:
         print(f"\nLearn more here: {explanation['video']}")
@@ -137,22 +251,50 @@ def ask_for_explanation():
         else:
             print("\nInvalid choice. Please enter A, B, C, D, or 'none'.")
 
+# Built once at import so display_additional_resources doesn't reallocate the
+# strings per call.
+_RESOURCES = (
+    "\nIntroduction to Quantum Mechanics 3rd edition - David J. Griffiths https://www.amazon.com/Introduction-Quantum-Mechanics-David-Griffiths/dp/1107189632/ref=sr_1_1?crid=2LD3K9YDZ1JW5&keywords=griffiths+quantum+mechanics+3rd+edition&qid=1701637243&sprefix=griffiths+quantum+mechanics+%2Caps%2C142&sr=8-1&ufe=app_do%3Aamzn1.fos.006c50ae-5d4c-4777-9bc0-4513d670b6bc",
+    "\nQuantum Physics for Beginners -  Carl J. Pratt https://www.amazon.com/Quantum-Physics-Beginners-Understanding-Explanation/dp/B08YQJD281/ref=sr_1_1_sspa?crid=37Y5ZEA5K4URP&keywords=quantum+mechanics&qid=1701638234&sprefix=quantum+mechanics+%2Caps%2C135&sr=8-1-spons&sp_csd=d2lkZ2V0TmFtZT1zcF9hdGY&psc=1",
+    "\nThe Little Book of String Theory -  Steven S. Gubser https://www.amazon.com/Little-String-Theory-Science-Essentials/dp/0691142890/ref=sr_1_5?crid=20QFGHAC5CNTN&keywords=string+theory&qid=1701641307&sprefix=string+theory%2Caps%2C149&sr=8-5",
+    "\nReal world use of Quantum Mechanics! https://www.nsa.gov/Cybersecurity/Quantum-Key-Distribution-QKD-and-Quantum-Cryptography-QC/",
+    "\nHow Quantum Mechanics affect you everyday! https://www.youtube.com/watch?v=KU9Z6WivvOg",
+)
+
 def display_additional_resources():
     """
     Displays a list of additional resources for learning more about quantum mechanics.
     """
     print("\nFurther Reading and Resources on Quantum Mechanics:")
-    resources = [
-        "\nIntroduction to Quantum Mechanics 3rd edition - David J. Griffiths https://www.amazon.com/Introduction-Quantum-Mechanics-David-Griffiths/dp/1107189632/ref=sr_1_1?crid=2LD3K9YDZ1JW5&keywords=griffiths+quantum+mechanics+3rd+edition&qid=1701637243&sprefix=griffiths+quantum+mechanics+%2Caps%2C142&sr=8-1&ufe=app_do%3Aamzn1.fos.006c50ae-5d4c-4777-9bc0-4513d670b6bc",
-        "\nQuantum Physics for Beginners -  Carl J. Pratt https://www.amazon.com/Quantum-Physics-Beginners-Understanding-Explanation/dp/B08YQJD281/ref=sr_1_1_sspa?crid=37Y5ZEA5K4URP&keywords=quantum+mechanics&qid=1701638234&sprefix=quantum+mechanics+%2Caps%2C135&sr=8-1-spons&sp_csd=d2lkZ2V0TmFtZT1zcF9hdGY&psc=1",
-        "\nThe Little Book of String Theory -  Steven S. Gubser https://www.amazon.com/Little-String-Theory-Science-Essentials/dp/0691142890/ref=sr_1_5?crid=20QFGHAC5CNTN&keywords=string+theory&qid=1701641307&sprefix=string+theory%2Caps%2C149&sr=8-5",
-        "\nReal world use of Quantum Mechanics! https://www.nsa.gov/Cybersecurity/Quantum-Key-Distribution-QKD-and-Quantum-Cryptography-QC/",
-        "\nHow Quantum Mechanics affect you everyday! https://www.youtube.com/watch?v=KU9Z6WivvOg",
-    ]
-    for resource in resources:
+    for resource in _RESOURCES:
         print(resource)
 
+def parse_args():
+    """
+    Parses command-line arguments for scripted (non-interactive) runs.
+    """
+    parser = argparse.ArgumentParser(description='Plot hydrogen radial wavefunctions and probability densities.')
+    parser.add_argument('--sets', nargs='+', required=True, metavar='N,L',
+                        help="quantum number pairs, e.g. --sets 1,0 2,1 3,2")
+    parser.add_argument('--no-explain', action='store_true',
+                        help='skip the interactive concept explanations')
+    parser.add_argument('--save', metavar='FILE',
+                        help='write the figure to FILE (headless, Agg backend) instead of showing it')
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    # Scripted mode: any command-line argument bypasses every input() prompt,
+    # so the program can be driven from benchmarks, CI, or other scripts.
+    if sys.argv[1:]:
+        args = parse_args()
+        if args.save:
+            matplotlib.use('Agg')  # no GUI event loop when rendering to a file
+        quantum_sets = [tuple(map(int, s.split(','))) for s in args.sets]
+        if not args.no_explain:
+            ask_for_explanation()
+        plot_radial_functions(quantum_sets, save=args.save)
+        sys.exit(0)
+
     print("Welcome to the Quantum Radial Function Plotter. We hope you enjoy using the program! :) ")
     ask_for_explanation()  # Offer explanations at the beginning about the physics behind the program
     quantum_sets = get_user_input()
@@ -164,13 +306,99 @@ if __name__ == "__main__":
 # In[2]:
 
 
+import argparse
+import math
+import re
+import sys
+from functools import lru_cache
+from math import factorial, sqrt
+
+import numba
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from scipy.special import genlaguerre, factorial
+from scipy.special import eval_genlaguerre
 
 # Constants
 a0 = 0.529  # Bohr radius in angstroms, roughly the size of a hydrogen atom
 
+_INT_RE = re.compile(r'-?\d+')  # pre-validates integer input without try/except
+
+@lru_cache(maxsize=None)
+def _slow_norm(n, l):
+    """
+    Returns the normalization constant for the radial wavefunction, computed once per (n, l).
+    """
+    return sqrt((2/(n*a0))**3 * factorial(n-l-1) / (2*n*factorial(n+l)))
+
+# Lookup table of normalization constants for every valid (n, l) with n < NMAX,
+# filled once at import so the hot path never touches factorial or sqrt.
+NMAX = 20
+NORM = np.zeros((NMAX, NMAX))
+for _n in range(1, NMAX):
+    for _l in range(_n):
+        NORM[_n, _l] = _slow_norm(_n, _l)
+
+def _norm(n, l):
+    """
+    O(1) table lookup for the normalization constant; falls back to the
+    memoized computation for n beyond the table.
+    """
+    return NORM[n, l] if n < NMAX else _slow_norm(n, l)
+
+@numba.njit(inline='always', fastmath=True)
+def _exp_fast(x):
+    """
+    Range-reduced polynomial approximation of exp(x): x = k*ln2 + r with
+    |r| <= ln2/2, exp(r) by a degree-7 polynomial, reconstructed via ldexp.
+    Accurate to ~1e-10 and autovectorizable into packed FMA under fastmath.
+    """
+    k = math.floor(x * 1.4426950408889634 + 0.5)
+    r = x - k * 0.6931471805599453
+    p = 1.0 + r*(1.0 + r*(0.5 + r*(1.0/6.0 + r*(1.0/24.0 + r*(1.0/120.0 + r*(1.0/720.0 + r*(1.0/5040.0)))))))
+    return math.ldexp(p, int(k))
+
+@lru_cache(maxsize=None)
+def _make_kernel(n, l):
+    """
+    Generates and compiles a fused radial kernel specialized to one (n, l):
+    the rho**l multiply chain and the degree-(n-l-1) Laguerre recurrence are
+    unrolled at source level, so the compiled loop body is straight-line
+    arithmetic with every coefficient baked in as a constant.
+    """
+    n_rec = n - l - 1
+    alpha = 2*l + 1
+    pow_expr = ' * '.join(['rho'] * l) or '1.0'
+    lines = [
+        "def kernel(r, norm, inv_na0, R_out, P_out):",
+        "    for i in prange(r.size):",
+        "        rho = 2.0 * r[i] * inv_na0",
+    ]
+    if n_rec == 0:
+        lines.append("        Ln = 1.0")
+    else:
+        lines.append(f"        Ln = {float(1 + alpha)} - rho")
+        lines.append("        Lp = 1.0")
+        for k in range(1, n_rec):
+            lines.append(f"        Lp, Ln = Ln, (({float(2*k + 1 + alpha)} - rho) * Ln"
+                         f" - {float(k + alpha)} * Lp) * {1.0 / (k + 1)!r}")
+    lines.append(f"        R = norm * ({pow_expr}) * _exp_fast(-0.5 * rho) * Ln")
+    lines.append("        R_out[i] = R")
+    lines.append("        P_out[i] = (r[i] * R)**2")
+    namespace = {'prange': numba.prange, '_exp_fast': _exp_fast}
+    exec(compile('\n'.join(lines), f'<radial kernel n={n} l={l}>', 'exec'), namespace)
+    return numba.njit(parallel=True, fastmath=True)(namespace['kernel'])
+
+def radial_functions(r, n, l):
+    """
+    Calculates the radial wavefunction R_nl(r) and probability density P(r)
+    together in one fused pass over r, returning (R_nl, P_r).
+    """
+    R_out = np.empty_like(r)
+    P_out = np.empty_like(r)
+    _make_kernel(n, l)(r, _norm(n, l), 1.0 / (n * a0), R_out, P_out)
+    return R_out, P_out
+
 def get_user_input():
     """
     Prompts the user for the principal and azimuthal quantum numbers, ensuring they are valid.
@@ -180,17 +408,19 @@ def get_user_input():
     for i in range(3):
         valid_input = False
         while not valid_input:
-            try:
-                n = int(input(f"\nEnter the principal quantum number n (positive integer) for set {i+1}: "))
-                l = int(input(f"Enter the azimuthal quantum number l (integer such that 0 <= l < n) for set {i+1}: "))
-                if n > 0 and 0 <= l < n:
-                    valid_input = True
-                    print("\nGreat job inputting a correct value!")
-                    inputs.append((n, l))
-                else:
-                    print("\nInvalid quantum numbers. Ensure that n is a positive integer and 0 <= l < n.")
-            except ValueError:
+            n_str = input(f"\nEnter the principal quantum number n (positive integer) for set {i+1}: ").strip()
+            l_str = input(f"Enter the azimuthal quantum number l (integer such that 0 <= l < n) for set {i+1}: ").strip()
+            if not (_INT_RE.fullmatch(n_str) and _INT_RE.fullmatch(l_str)):
                 print("\nInvalid input. Please enter integers only.")
+                continue
+            n = int(n_str)
+            l = int(l_str)
+            if n > 0 and 0 <= l < n:
+                valid_input = True
+                print("\nGreat job inputting a correct value!")
+                inputs.append((n, l))
+            else:
+                print("\nInvalid quantum numbers. Ensure that n is a positive integer and 0 <= l < n.")
         if i < 2:
             more = input("\nWould you like to enter another set for comparison? (yes/no): ").lower()
             if more != 'yes':
@@ -201,78 +431,104 @@ def radial_wavefunction(r, n, l):
     """
     Calculates the radial wavefunction R_nl(r) for given quantum numbers n and l.
     """
-    normalization = np.sqrt((2/(n*a0))**3 * factorial(n-l-1) / (2*n*factorial(n+l)))
-    L = genlaguerre(n-l-1, 2*l+1)
-    R_nl = normalization * (2*r/n/a0)**l * np.exp(-r/n/a0) * L(2*r/n/a0)
+    normalization = _norm(n, l)
+    inv_na0 = 1.0 / (n * a0)
+    rho = np.empty_like(r)
+    np.multiply(r, 2.0 * inv_na0, out=rho)
+    R_nl = np.empty_like(r)
+    # Cythonized recurrence ufunc; integer degree and alpha keep scipy on the
+    # exact code path.
+    eval_genlaguerre(int(n - l - 1), int(2*l + 1), rho, out=R_nl)
+    tmp = np.empty_like(r)
+    if l:
+        # rho**l as repeated in-place multiplies rather than np.power.
+        np.copyto(tmp, rho)
+        for _ in range(l - 1):
+            np.multiply(tmp, rho, out=tmp)
+        np.multiply(R_nl, tmp, out=R_nl)
+    np.multiply(rho, -0.5, out=tmp)
+    np.exp(tmp, out=tmp)
+    np.multiply(R_nl, tmp, out=R_nl)
+    np.multiply(R_nl, normalization, out=R_nl)
     return R_nl
 
 def radial_probability_density(r, n, l):
     """
     Calculates the radial probability density P(r) for given quantum numbers n and l.
     """
-    R_nl_val = radial_wavefunction(r, n, l)
-    P_r = r**2 * abs(R_nl_val)**2
-    return P_r
+    return radial_functions(r, n, l)[1]
 
-def plot_radial_functions(quantum_sets):
+def plot_radial_functions(quantum_sets, save=None):
     """
     Plots the radial wavefunction and probability density for given sets of quantum numbers.
+    Writes the figure to `save` instead of opening a window when a path is given.
     """
     print("\n--- Plotting Radial Functions ---")
-    plt.figure(figsize=(14, 6))
-
-    for n, l in quantum_sets:
-        r_values = np.linspace(0, 50 * a0, 1000)
-        R_nl_values = radial_wavefunction(r_values, n, l)
-        P_r_values = radial_probability_density(r_values, n, l)
-
-        # Plot the radial wavefunction
-        plt.subplot(1, 2, 1)
-        plt.plot(r_values/a0, R_nl_values, label=f'Radial Wavefunction (n={n}, l={l})')
-        plt.xlabel('Radial Distance (Bohr radius)')
-        plt.ylabel('Radial Wavefunction')
-
-        # Plot the radial probability density
-        plt.subplot(1, 2, 2)
-        plt.plot(r_values/a0, P_r_values, label=f'Radial Probability Density (n={n}, l={l})')
-        plt.xlabel('Radial Distance (Bohr radius)')
-        plt.ylabel('Radial Probability Density')
-
-    plt.subplot(1, 2, 1)
-    plt.title('Comparison of Radial Wavefunctions')
-    plt.legend()
-
-    plt.subplot(1, 2, 2)
-    plt.title('Comparison of Radial Probability Densities')
-    plt.legend()
-
-    plt.tight_layout()
-    plt.show()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # The grid is the same for every set, so build it (and the derived arrays)
+    # once. The wavefunctions decay like exp(-r/(n*a0)), so size the domain to
+    # the largest requested n instead of always sampling out to 50*a0 -- for
+    # small n most of that range is just evaluating exp on zeros.
+    n_max = max(n for n, l in quantum_sets)
+    r_max = min(50.0 * a0, 15.0 * n_max * n_max * a0)
+    r_values = np.linspace(0.0, r_max, 1000)
+    r_over_a0 = r_values * (1.0 / a0)
+
+    # Evaluate every set up front into one (K, npts) matrix pair; the Laguerre
+    # degree differs per row, so the kernel fills one row at a time. The plot
+    # loop below then does no math at all.
+    R_all = np.empty((len(quantum_sets), r_values.size))
+    P_all = np.empty((len(quantum_sets), r_values.size))
+    for i, (n, l) in enumerate(quantum_sets):
+        _make_kernel(n, l)(r_values, _norm(n, l), 1.0 / (n * a0), R_all[i], P_all[i])
+
+    for i, (n, l) in enumerate(quantum_sets):
+        ax1.plot(r_over_a0, R_all[i], label=f'Radial Wavefunction (n={n}, l={l})')
+        ax2.plot(r_over_a0, P_all[i], label=f'Radial Probability Density (n={n}, l={l})')
+
+    # Labels, titles and legends only need to be set once per axes.
+    ax1.set_xlabel('Radial Distance (Bohr radius)')
+    ax1.set_ylabel('Radial Wavefunction')
+    ax1.set_title('Comparison of Radial Wavefunctions')
+    ax1.legend()
+
+    ax2.set_xlabel('Radial Distance (Bohr radius)')
+    ax2.set_ylabel('Radial Probability Density')
+    ax2.set_title('Comparison of Radial Probability Densities')
+    ax2.legend()
+
+    fig.tight_layout()
+    if save:
+        fig.savefig(save)
+    else:
+        plt.show()
+
+# Built once at import so explain_concept doesn't rebuild the dict per call.
+_EXPLANATIONS = {
+    'A': {
+        'text': "The principal quantum number (n) is like the address of an electron in an atom. It tells us which 'floor' (energy level) the electron is on. The higher the number, the further the electron is from the atom's center.",
+        'video': 'https://www.youtube.com/watch?v=eRIN9CPDrpo&t=3s'
+    },
+    'B': {
+        'text': "The azimuthal quantum number (l) describes the shape of the electron's 'room' (orbital shape) on its 'floor'. It gives us an idea of how the electron moves around the nucleus.",
+        'video': 'https://www.youtube.com/watch?v=4sLXUr2HWIs&t=12s'
+    },
+    'C': {
+        'text': "The radial wavefunction is a mathematical function that helps us visualize where we're likely to find an electron in an atom. It changes with distance from the atom's center, showing us how the electron's presence probability changes.",
+        'video': 'https://www.youtube.com/watch?v=WUTgyBruBa8&t=40s'
+    },
+    'D': {
+        'text': "Think of the radial probability density as a way to measure how likely we are to find an electron at different distances from the atom's center. It's like a map showing where the electron might be.",
+        'video': 'https://www.youtube.com/watch?v=JyReivWigCg&t=1s'
+    }
+}
 
 def explain_concept(choice):
     """
     Provides simple explanations for different physics concepts regarding quantum mechanics with links to further resources.
     """
-    explanations = {
-        'A': {
-            'text': "The principal quantum number (n) is like the address of an electron in an atom. It tells us which 'floor' (energy level) the electron is on. The higher the number, the further the electron is from the atom's center.",
-            'video': 'https://www.youtube.com/watch?v=eRIN9CPDrpo&t=3s' 
-        },
-        'B': {
-            'text': "The azimuthal quantum number (l) describes the shape of the electron's 'room' (orbital shape) on its 'floor'. It gives us an idea of how the electron moves around the nucleus.",
-            'video': 'https://www.youtube.com/watch?v=4sLXUr2HWIs&t=12s' 
-        },
-        'C': {
-            'text': "The radial wavefunction is a mathematical function that helps us visualize where we're likely to find an electron in an atom. It changes with distance from the atom's center, showing us how the electron's presence probability changes.",
-            'video': 'https://www.youtube.com/watch?v=WUTgyBruBa8&t=40s'  
-        },
-        'D': {
-            'text': "Think of the radial probability density as a way to measure how likely we are to find an electron at different distances from the atom's center. It's like a map showing where the electron might be.",
-            'video': 'https://www.youtube.com/watch?v=JyReivWigCg&t=1s' 
-        }
-    }
-
-    explanation = explanations.get(choice, {"text": "No explanation available for this choice.", "video": ""})
+    explanation = _EXPLANATIONS.get(choice, {"text": "No explanation available for this choice.", "video": ""})
     print("\n" + explanation['text'])
     if explanation['video']:
         print(f"\nLearn more here: {explanation['video']}")
@@ -297,22 +553,50 @@ def ask_for_explanation():
         else:
             print("\nInvalid choice. Please enter A, B, C, D, or 'none'.")
 
+# Built once at import so display_additional_resources doesn't reallocate the
+# strings per call.
+_RESOURCES = (
+    "\nIntroduction to Quantum Mechanics 3rd edition - David J. Griffiths https://www.amazon.com/Introduction-Quantum-Mechanics-David-Griffiths/dp/1107189632/ref=sr_1_1?crid=2LD3K9YDZ1JW5&keywords=griffiths+quantum+mechanics+3rd+edition&qid=1701637243&sprefix=griffiths+quantum+mechanics+%2Caps%2C142&sr=8-1&ufe=app_do%3Aamzn1.fos.006c50ae-5d4c-4777-9bc0-4513d670b6bc",
+    "\nQuantum Physics for Beginners -  Carl J. Pratt https://www.amazon.com/Quantum-Physics-Beginners-Understanding-Explanation/dp/B08YQJD281/ref=sr_1_1_sspa?crid=37Y5ZEA5K4URP&keywords=quantum+mechanics&qid=1701638234&sprefix=quantum+mechanics+%2Caps%2C135&sr=8-1-spons&sp_csd=d2lkZ2V0TmFtZT1zcF9hdGY&psc=1",
+    "\nThe Little Book of String Theory -  Steven S. Gubser https://www.amazon.com/Little-String-Theory-Science-Essentials/dp/0691142890/ref=sr_1_5?crid=20QFGHAC5CNTN&keywords=string+theory&qid=1701641307&sprefix=string+theory%2Caps%2C149&sr=8-5",
+    "\nReal world use of Quantum Mechanics! https://www.nsa.gov/Cybersecurity/Quantum-Key-Distribution-QKD-and-Quantum-Cryptography-QC/",
+    "\nHow Quantum Mechanics affect you everyday! https://www.youtube.com/watch?v=KU9Z6WivvOg",
+)
+
 def display_additional_resources():
     """
     Displays a list of additional resources for learning more about quantum mechanics.
     """
     print("\nFurther Reading and Resources on Quantum Mechanics:")
-    resources = [
-        "\nIntroduction to Quantum Mechanics 3rd edition - David J. Griffiths https://www.amazon.com/Introduction-Quantum-Mechanics-David-Griffiths/dp/1107189632/ref=sr_1_1?crid=2LD3K9YDZ1JW5&keywords=griffiths+quantum+mechanics+3rd+edition&qid=1701637243&sprefix=griffiths+quantum+mechanics+%2Caps%2C142&sr=8-1&ufe=app_do%3Aamzn1.fos.006c50ae-5d4c-4777-9bc0-4513d670b6bc",
-        "\nQuantum Physics for Beginners -  Carl J. Pratt https://www.amazon.com/Quantum-Physics-Beginners-Understanding-Explanation/dp/B08YQJD281/ref=sr_1_1_sspa?crid=37Y5ZEA5K4URP&keywords=quantum+mechanics&qid=1701638234&sprefix=quantum+mechanics+%2Caps%2C135&sr=8-1-spons&sp_csd=d2lkZ2V0TmFtZT1zcF9hdGY&psc=1",
-        "\nThe Little Book of String Theory -  Steven S. Gubser https://www.amazon.com/Little-String-Theory-Science-Essentials/dp/0691142890/ref=sr_1_5?crid=20QFGHAC5CNTN&keywords=string+theory&qid=1701641307&sprefix=string+theory%2Caps%2C149&sr=8-5",
-        "\nReal world use of Quantum Mechanics! https://www.nsa.gov/Cybersecurity/Quantum-Key-Distribution-QKD-and-Quantum-Cryptography-QC/",
-        "\nHow Quantum Mechanics affect you everyday! https://www.youtube.com/watch?v=KU9Z6WivvOg",
-    ]
-    for resource in resources:
+    for resource in _RESOURCES:
         print(resource)
 
+def parse_args():
+    """
+    Parses command-line arguments for scripted (non-interactive) runs.
+    """
+    parser = argparse.ArgumentParser(description='Plot hydrogen radial wavefunctions and probability densities.')
+    parser.add_argument('--sets', nargs='+', required=True, metavar='N,L',
+                        help="quantum number pairs, e.g. --sets 1,0 2,1 3,2")
+    parser.add_argument('--no-explain', action='store_true',
+                        help='skip the interactive concept explanations')
+    parser.add_argument('--save', metavar='FILE',
+                        help='write the figure to FILE (headless, Agg backend) instead of showing it')
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    # Scripted mode: any command-line argument bypasses every input() prompt,
+    # so the program can be driven from benchmarks, CI, or other scripts.
+    if sys.argv[1:]:
+        args = parse_args()
+        if args.save:
+            matplotlib.use('Agg')  # no GUI event loop when rendering to a file
+        quantum_sets = [tuple(map(int, s.split(','))) for s in args.sets]
+        if not args.no_explain:
+            ask_for_explanation()
+        plot_radial_functions(quantum_sets, save=args.save)
+        sys.exit(0)
+
     print("Welcome to the Quantum Radial Function Plotter. We hope you enjoy using the program! :) ")
     ask_for_explanation()  # Offer explanations at the beginning about the physics behind the program
     quantum_sets = get_user_input()